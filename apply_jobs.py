@@ -2,32 +2,77 @@
 Job application automation for Greenhouse, Lever, Ashby, and similar ATS boards.
 
 - Fills application forms from config (name, email, phone, LinkedIn, resume, cover letter).
+- Prepares several job pages in parallel (one browser context each) while the user works through them.
 - User completes any custom questions and submits in the browser, then presses Enter to continue.
 - Tracks applied jobs, supports resume, logs applications, and auto-detects board from URL.
 """
 
+import asyncio
 import json
-import time
 import os
-import random
+import sys
+import threading
+import time
 from datetime import datetime
+from functools import lru_cache
+from urllib.parse import parse_qs, urlparse
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import async_playwright
 
-from playwright.sync_api import sync_playwright
+try:
+    import orjson
+except ImportError:  # Optional: falls back to stdlib json
+    orjson = None
 
-from boards import BOARDS, detect_board_from_url, get_board, get_search_site
+try:
+    import httpx
+    from selectolax.parser import HTMLParser
+except ImportError:  # Optional: without them the search always runs in the browser
+    httpx = HTMLParser = None
+
+from boards import BOARDS, BoardRecord, detect_board_from_url, get_board, get_search_site
 
 # ---------------------------------------------------------------------------
 # State file names (created/updated in the script directory)
 # ---------------------------------------------------------------------------
 APPLIED_JOBS_FILE = "applied_jobs.json"  # URLs we've already applied to (skip on next run)
-PROGRESS_FILE = "progress.json"          # Current run's job list + last index (for --resume)
+APPLIED_JOBS_LOG = "applied_jobs.jsonl"  # URLs applied to this run, one per line (merged into APPLIED_JOBS_FILE)
+PROGRESS_URLS_FILE = "progress_urls.json"  # Current run's job list, written once at start (for --resume)
+PROGRESS_INDEX_FILE = "progress_idx.txt"   # Index of the last job handled, rewritten after each job
+LEGACY_PROGRESS_FILE = "progress.json"     # Older single-file progress (job_urls + last_index); read once, then removed
 APPLICATIONS_LOG = "applications.log"    # Append-only log: timestamp, board, company, title, URL
+SEARCH_CACHE_FILE = "search_cache.json"  # DuckDuckGo result URLs per (board, query), reused for SEARCH_CACHE_TTL
+PROFILE_DIR = ".pwcache"                 # Chromium profile reused across runs with --persistent
+
+PROFILE_DISK_CACHE_BYTES = 128 * 1024 * 1024  # HTTP cache size for the --persistent profile
+DDG_HTML_URL = "https://html.duckduckgo.com/html/"  # Script-free results page used for the HTTP search
+HTTP_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+SEARCH_CACHE_TTL = 30 * 60  # Seconds a cached search result stays fresh
+DEFAULT_WORKERS = 5  # Browser contexts preparing job pages in parallel while the user submits
+NAVIGATION_TIMEOUT_MS = 10000  # Give up waiting on slow page loads; the form wait (same budget) takes over from there
+FORM_POLL_INTERVAL = 0.25      # Seconds between checks for a form that may live in an iframe
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}  # Not needed to fill forms; aborted to speed up page loads
+# Captcha providers are never blocked: the user has to solve their image challenges to submit
+CAPTCHA_URL_PARTS = ("google.com/recaptcha", "recaptcha.net", "gstatic.com/recaptcha", "hcaptcha.com", "challenges.cloudflare.com")
+
+
+def json_loads(data):
+    """Parse JSON text, using orjson when installed."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def json_dumps(obj) -> str:
+    """Serialize obj as 2-space indented JSON, using orjson when installed."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
 
 
 def load_config():
     """Load config.json (personal info, resume path, search query, board, cover letter template)."""
     with open("config.json", "r", encoding="utf-8") as f:
-        return json.load(f)
+        return json_loads(f.read())
 
 
 # ---------------------------------------------------------------------------
@@ -39,144 +84,381 @@ def load_applied_jobs() -> set:
         return set()
     try:
         with open(APPLIED_JOBS_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
+            data = json_loads(f.read())
         return set(data.get("urls", []))
     except Exception:
         return set()
 
 
-def save_applied_job(url: str):
-    """Append this URL to applied_jobs.json so we skip it on future runs."""
-    applied = load_applied_jobs()
-    applied.add(url)
-    with open(APPLIED_JOBS_FILE, "w", encoding="utf-8") as f:
-        json.dump({"urls": list(applied)}, f, indent=2)
+def load_applied_log() -> set:
+    """Return set of URLs from applied_jobs.jsonl (left behind by a run that didn't shut down cleanly)."""
+    if not os.path.exists(APPLIED_JOBS_LOG):
+        return set()
+    urls = set()
+    with open(APPLIED_JOBS_LOG, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                urls.add(json_loads(line))
+            except ValueError:
+                continue  # Partially written last line
+    return urls
+
+
+class AppliedStore:
+    """Applied job URLs, loaded once per run and kept in memory.
+
+    add() appends to applied_jobs.jsonl so nothing is lost on a crash; close() writes the
+    consolidated applied_jobs.json once and removes the sidecar.
+    """
+
+    def __init__(self):
+        self.urls = load_applied_jobs()
+        pending = load_applied_log()
+        self._dirty = bool(pending - self.urls)
+        self.urls |= pending
+        self._fh = None
+
+    def __contains__(self, url: str) -> bool:
+        return url in self.urls
+
+    def __len__(self) -> int:
+        return len(self.urls)
+
+    def add(self, url: str):
+        """Record this URL so we skip it on future runs."""
+        if url in self.urls:
+            return
+        self.urls.add(url)
+        self._dirty = True
+        if self._fh is None:
+            self._fh = open(APPLIED_JOBS_LOG, "a", buffering=1, encoding="utf-8")
+        self._fh.write(json_dumps(url) + "\n")
+
+    def close(self):
+        """Merge this run's URLs into applied_jobs.json and drop the sidecar log."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        if self._dirty:
+            with open(APPLIED_JOBS_FILE, "w", encoding="utf-8") as f:
+                f.write(json_dumps({"urls": list(self.urls)}))
+            self._dirty = False
+        if os.path.exists(APPLIED_JOBS_LOG):
+            os.remove(APPLIED_JOBS_LOG)
 
 
 # ---------------------------------------------------------------------------
 # Progress (for --resume: continue from last job in the same run)
 # ---------------------------------------------------------------------------
 def load_progress():
-    """Load progress.json; returns None if missing or invalid. Contains job_urls and last_index."""
-    if not os.path.exists(PROGRESS_FILE):
+    """Load progress_urls.json + progress_idx.txt; returns None if missing or invalid. Contains job_urls and last_index."""
+    if not os.path.exists(PROGRESS_URLS_FILE):
+        return load_legacy_progress()
+    try:
+        with open(PROGRESS_URLS_FILE, "r", encoding="utf-8") as f:
+            job_urls = json_loads(f.read())
+        last_index = -1
+        if os.path.exists(PROGRESS_INDEX_FILE):
+            with open(PROGRESS_INDEX_FILE, "r", encoding="utf-8") as f:
+                last_index = int(f.read().strip() or -1)
+        return {"job_urls": job_urls, "last_index": last_index}
+    except Exception:
+        return None
+
+
+def load_legacy_progress():
+    """Load progress.json written by older versions; returns None if missing or invalid."""
+    if not os.path.exists(LEGACY_PROGRESS_FILE):
         return None
     try:
-        with open(PROGRESS_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(LEGACY_PROGRESS_FILE, "r", encoding="utf-8") as f:
+            progress = json_loads(f.read())
+        print(f"Using progress from {LEGACY_PROGRESS_FILE} (older format).")
+        return progress
     except Exception:
         return None
 
 
-def save_progress(job_urls: list, last_index: int):
-    """Save current job list and index so we can resume with --resume after interruption."""
-    with open(PROGRESS_FILE, "w", encoding="utf-8") as f:
-        json.dump({"job_urls": job_urls, "last_index": last_index}, f, indent=2)
+def start_progress(job_urls: list):
+    """Save this run's job list once; save_progress then only records the index. Replaces any older progress.json."""
+    if os.path.exists(LEGACY_PROGRESS_FILE):
+        os.remove(LEGACY_PROGRESS_FILE)
+    with open(PROGRESS_URLS_FILE, "w", encoding="utf-8") as f:
+        f.write(json_dumps(job_urls))
+    if os.path.exists(PROGRESS_INDEX_FILE):
+        os.remove(PROGRESS_INDEX_FILE)
+
+
+def save_progress(last_index: int):
+    """Save the last handled index (a few bytes) so we can resume with --resume after interruption."""
+    with open(PROGRESS_INDEX_FILE, "w", encoding="utf-8") as f:
+        f.write(str(last_index))
 
 
 def clear_progress():
-    """Remove progress.json when a run completes normally."""
-    if os.path.exists(PROGRESS_FILE):
-        os.remove(PROGRESS_FILE)
+    """Remove the progress files when a run completes normally."""
+    for path in (PROGRESS_URLS_FILE, PROGRESS_INDEX_FILE, LEGACY_PROGRESS_FILE):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+# ---------------------------------------------------------------------------
+# Search cache (skip DuckDuckGo when the same board + query ran recently)
+# ---------------------------------------------------------------------------
+def load_search_cache() -> dict:
+    """Load search_cache.json as {"board_id:query": {"urls": [...], "ts": epoch}}. Empty dict if missing or invalid."""
+    if not os.path.exists(SEARCH_CACHE_FILE):
+        return {}
+    try:
+        with open(SEARCH_CACHE_FILE, "r", encoding="utf-8") as f:
+            return json_loads(f.read())
+    except Exception:
+        return {}
 
 
-def log_application(url: str, job_title: str, company: str, board_name: str):
-    """Append one line to applications.log (timestamp, board, company, title, URL)."""
+def get_cached_search(board_id: str, query: str) -> list | None:
+    """Return cached URLs for (board_id, query) if younger than SEARCH_CACHE_TTL, else None."""
+    entry = load_search_cache().get(f"{board_id}:{query}")
+    if entry and time.time() - entry.get("ts", 0) < SEARCH_CACHE_TTL:
+        return entry.get("urls", [])
+    return None
+
+
+def cache_search(board_id: str, query: str, urls: list):
+    """Store URLs for (board_id, query), dropping entries that have expired."""
+    now = time.time()
+    cache = {k: v for k, v in load_search_cache().items() if now - v.get("ts", 0) < SEARCH_CACHE_TTL}
+    cache[f"{board_id}:{query}"] = {"urls": urls, "ts": now}
+    with open(SEARCH_CACHE_FILE, "w", encoding="utf-8") as f:
+        f.write(json_dumps(cache))
+
+
+def log_application(fh, url: str, job_title: str, company: str, board_name: str):
+    """Append one line to applications.log (timestamp, board, company, title, URL) via the run's open handle."""
     line = f"{datetime.now().isoformat()}\t{board_name}\t{company}\t{job_title}\t{url}\n"
-    with open(APPLICATIONS_LOG, "a", encoding="utf-8") as f:
-        f.write(line)
+    fh.write(line)
     print(f"   - Logged to {APPLICATIONS_LOG}")
 
 
-def human_delay(min_s=1, max_s=3):
-    """Random short delay to mimic human behavior and reduce detection risk."""
-    time.sleep(random.uniform(min_s, max_s))
+# ---------------------------------------------------------------------------
+# Console: Enter prompt for the user, output from background workers
+# ---------------------------------------------------------------------------
+_held_output = None  # List of held worker lines while the Enter prompt is showing, else None
+
+
+def worker_print(msg: str):
+    """Print a line from a background worker, or hold it until the user answers the Enter prompt."""
+    if _held_output is not None:
+        _held_output.append(msg)
+    else:
+        print(msg)
+
+
+_stdin_pending = b""  # Bytes read from stdin beyond the last line handed to prompt_enter
+
+
+def _read_stdin_line() -> str:
+    """Return the next line from stdin's raw fd (without the newline), keeping any extra bytes for the next call.
+
+    Uses os.read rather than input(): a daemon thread blocked inside sys.stdin's buffered reader
+    holds its lock and makes interpreter shutdown abort. Raises EOFError at end of input.
+    """
+    global _stdin_pending
+    while b"\n" not in _stdin_pending:
+        data = os.read(sys.stdin.fileno(), 4096)
+        if not data:
+            if not _stdin_pending:
+                raise EOFError("EOF when reading a line")
+            line, _stdin_pending = _stdin_pending, b""  # Last line without a trailing newline
+            return line.decode(errors="replace").rstrip("\r")
+        _stdin_pending += data
+    line, _stdin_pending = _stdin_pending.split(b"\n", 1)
+    return line.decode(errors="replace").rstrip("\r")
+
+
+async def prompt_enter(text: str) -> str:
+    """Read a line without blocking the event loop; worker output is held back until it's answered.
+
+    stdin is read on a daemon thread (not the default executor) so Ctrl+C ends the run right away
+    instead of waiting for the pending read at interpreter shutdown.
+    """
+    global _held_output
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def resolve(line, exc):
+        if not future.done():
+            if exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(line)
+
+    def read():
+        try:
+            line, exc = _read_stdin_line(), None
+        except (OSError, EOFError) as e:
+            line, exc = None, e
+        try:
+            loop.call_soon_threadsafe(resolve, line, exc)
+        except RuntimeError:
+            pass  # Loop already closed (run was interrupted)
+
+    print(text, end="", flush=True)
+    _held_output = []
+    try:
+        threading.Thread(target=read, daemon=True).start()
+        return await future
+    finally:
+        held, _held_output = _held_output, None
+        for msg in held:
+            print(msg)
+
+
+# ---------------------------------------------------------------------------
+# Browser contexts
+# ---------------------------------------------------------------------------
+def chromium_installed(p) -> bool:
+    """Return True if Playwright's Chromium build is present; otherwise print how to install it."""
+    if os.path.exists(p.chromium.executable_path):
+        return True
+    print("Chromium for Playwright is not installed. Run: playwright install chromium")
+    return False
+
+
+async def block_heavy_resources(route):
+    """Abort images, media and fonts (except from captcha providers); let every other request through."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES and not any(part in request.url for part in CAPTCHA_URL_PARTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def new_context(browser):
+    """Create a browser context that skips heavy resources (see BLOCKED_RESOURCE_TYPES) and times out slow navigations."""
+    context = await browser.new_context()
+    context.set_default_navigation_timeout(NAVIGATION_TIMEOUT_MS)
+    await context.route("**/*", block_heavy_resources)
+    return context
 
 
 # ---------------------------------------------------------------------------
 # Search: open DuckDuckGo in browser and collect job links for the given board
 # ---------------------------------------------------------------------------
-def search_jobs_via_browser(page, query: str, board_id: str = "all") -> list:
+def build_search_query(query: str, board_id: str = "all") -> str:
+    """Return the DuckDuckGo query: site: filter for the board (OR of all boards for 'all') plus the search terms."""
+    if board_id == "all":
+        # Construct a combined query: (site:A OR site:B) query
+        sites = [b.search_site.replace("site:", "") for b in BOARDS.values()]
+        site_query = " OR ".join([f"site:{site}" for site in sites])
+        return f"({site_query}) {query}"
+    # Specific board search
+    return f"{get_search_site(board_id)} {query}"
+
+
+def filter_job_links(hrefs: list, board_id: str = "all") -> list:
+    """Keep unique links matching the requested board (or any known board for 'all'), in order. Returns up to 20."""
+    results = []
+    seen = set()  # Membership check for results (keeps the list for ordering)
+    for href in hrefs:
+        if not href:
+            continue
+        bid = detect_board_from_url(href)
+        if bid and (board_id == "all" or bid == board_id):
+            if href not in seen:
+                seen.add(href)
+                results.append(href)
+    return results[:20]
+
+
+def unwrap_ddg_redirect(href: str) -> str:
+    """Return the target URL of a DuckDuckGo redirect link (//duckduckgo.com/l/?uddg=...), or href unchanged."""
+    target = parse_qs(urlparse(href).query).get("uddg")
+    return target[0] if target else href
+
+
+async def search_jobs_via_http(query: str, board_id: str = "all") -> list | None:
+    """Search DuckDuckGo's HTML endpoint without a browser.
+
+    Returns up to 20 job URLs, or None if httpx/selectolax aren't installed, the request fails,
+    or no job links come back (usually DuckDuckGo serving a bot check) so the caller can fall back to the browser.
+    """
+    if httpx is None:
+        return None
+    full_query = build_search_query(query, board_id)
+    print(f"Searching {'ALL boards' if board_id == 'all' else board_id}: {full_query} via HTTP...")
+    try:
+        async with httpx.AsyncClient(timeout=10, follow_redirects=True, headers={"User-Agent": HTTP_USER_AGENT}) as client:
+            resp = await client.get(DDG_HTML_URL, params={"q": full_query})
+            resp.raise_for_status()
+    except httpx.HTTPError as e:
+        print(f"   - HTTP search failed ({e}); falling back to browser.")
+        return None
+    hrefs = [unwrap_ddg_redirect(a.attributes.get("href") or "") for a in HTMLParser(resp.text).css("a[href]")]
+    return filter_job_links(hrefs, board_id) or None
+
+
+async def search_jobs_via_browser(page, query: str, board_id: str = "all") -> list:
     """Use DuckDuckGo in the browser to collect job links.
     
     If board_id is 'all' (default), searches for all defined boards using an OR query.
     Otherwise, searches only for the specified board.
     Returns up to 20 URLs.
     """
-    if board_id == "all":
-        # Construct a combined query: (site:A OR site:B) query
-        sites = [b["search_site"].replace("site:", "") for b in BOARDS.values()]
-        site_query = " OR ".join([f"site:{site}" for site in sites])
-        full_query = f"({site_query}) {query}"
-        print(f"Searching ALL boards: {full_query} via browser...")
-    else:
-        # Specific board search
-        search_site = get_search_site(board_id)
-        full_query = f"{search_site} {query}"
-        print(f"Searching {board_id}: {full_query} via browser...")
+    full_query = build_search_query(query, board_id)
+    print(f"Searching {'ALL boards' if board_id == 'all' else board_id}: {full_query} via browser...")
 
     # Go to DDG
-    page.goto(f"https://duckduckgo.com/?q={full_query.replace(' ', '+')}&t=h_&ia=web")
-    human_delay(2, 4)
+    try:
+        await page.goto(f"https://duckduckgo.com/?q={full_query.replace(' ', '+')}&t=h_&ia=web", wait_until="domcontentloaded")
+    except PlaywrightTimeoutError:
+        pass  # Results may still render; wait_for_selector below decides
 
-    results = []
     # Collect links matching ANY known board pattern
     # usage of wait_for_selector ensures results are loaded
     try:
-        page.wait_for_selector('a[href*="http"]', timeout=5000)
+        await page.wait_for_selector('a[href*="http"]', timeout=5000)
     except:
         pass
 
-    found_links = page.query_selector_all('a[href]')
-    
-    for link in found_links:
-        href = link.get_attribute("href")
-        if not href:
-            continue
-            
-        # Check against the requested board(s)
-        for bid, board in BOARDS.items():
-            # If we asked for a specific board, skip others
-            if board_id != "all" and bid != board_id:
-                continue
-                
-            # Check if link matches this board's patterns
-            if all(p in href for p in board["url_patterns"]):
-                if href not in results:
-                    results.append(href)
-                break # Matched a board, move to next link
-
-    return results[:20]
+    # All hrefs as plain strings in one round-trip (no per-link element handles)
+    hrefs = await page.eval_on_selector_all('a[href]', '(els) => els.map(e => e.getAttribute("href"))')
+    return filter_job_links(hrefs, board_id)
 
 
 # ---------------------------------------------------------------------------
 # Job page: extract title/company and fill form using board-specific selectors
 # ---------------------------------------------------------------------------
-def get_job_context(page, board: dict) -> tuple[str, str]:
+# In-page helper: first non-empty text (< 200 chars) for each selector list, in one round-trip
+JOB_CONTEXT_JS = """
+([titleSels, companySels]) => {
+    const firstText = (sels, useAlt) => {
+        for (const sel of sels) {
+            let el = null;
+            try { el = document.querySelector(sel); } catch (e) { continue; }
+            if (!el) continue;
+            const t = (el.innerText || (useAlt && el.getAttribute("alt")) || "").trim();
+            if (t && t.length < 200) return t;
+        }
+        return null;
+    };
+    return { title: firstText(titleSels, false), company: firstText(companySels, true) };
+}
+"""
+
+
+async def get_job_context(page, board: BoardRecord) -> tuple[str, str]:
     """Extract job title and company name from the page using the board's selectors. Returns (title, company)."""
-    title, company = "Unknown role", "Unknown company"
-    for sel in board.get("job_title_selectors", []):
-        try:
-            el = page.query_selector(sel)
-            if el:
-                t = (el.inner_text() or "").strip()
-                if t and len(t) < 200:
-                    title = t
-                    break
-        except Exception:
-            continue
-    for sel in board.get("company_selectors", []):
-        try:
-            el = page.query_selector(sel)
-            if el:
-                c = (el.inner_text() or el.get_attribute("alt") or "").strip()
-                if c and len(c) < 200:
-                    company = c
-                    break
-        except Exception:
-            continue
-    return title, company
+    try:
+        found = await page.evaluate(
+            JOB_CONTEXT_JS, [list(board.job_title_selectors), list(board.company_selectors)]
+        )
+    except Exception:
+        found = {}
+    return found.get("title") or "Unknown role", found.get("company") or "Unknown company"
 
 
+@lru_cache(maxsize=256)
 def fill_cover_letter_template(template: str, job_title: str, company: str) -> str:
     """Replace {job_title}, {company_name}, {company} in the template with actual values."""
     return (
@@ -186,147 +468,260 @@ def fill_cover_letter_template(template: str, job_title: str, company: str) -> s
     )
 
 
-def find_form(page, board: dict):
-    """Locate the application form on the main page or inside an iframe (e.g. Greenhouse). Returns (form, page_or_frame)."""
-    form_selector = board.get("form_selector", "form")
-    # Try main document first
-    try:
-        form = page.wait_for_selector(form_selector, timeout=3000)
-        if form:
-            return form, page
-    except Exception:
-        pass
+async def find_form(page, board: BoardRecord):
+    """Locate the application form on the main page or inside an iframe (e.g. Greenhouse). Returns (form, page_or_frame).
 
-    # If board uses an iframe (e.g. Greenhouse), search frames
-    if board.get("form_in_iframe"):
-        for frame in page.frames:
+    This is the only wait after domcontentloaded, so it gets the full NAVIGATION_TIMEOUT_MS budget for
+    client-rendered forms, and returns as soon as the form is attached.
+    """
+    form_selector = board.form_selector
+    if not board.form_in_iframe:
+        try:
+            form = await page.wait_for_selector(form_selector, state="attached", timeout=NAVIGATION_TIMEOUT_MS)
+            if form:
+                return form, page
+        except Exception:
+            pass
+        return None, None
+
+    # Board may embed the form in an iframe (e.g. Greenhouse): poll the main document and every frame
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + NAVIGATION_TIMEOUT_MS / 1000
+    while True:
+        for frame in page.frames:  # Main frame comes first
             try:
-                form = frame.wait_for_selector(form_selector, timeout=1000)
+                form = await frame.query_selector(form_selector)
                 if form:
-                    return form, frame
+                    return form, page if frame is page.main_frame else frame
             except Exception:
                 pass
-    return None, None
+        if loop.time() >= deadline:
+            return None, None
+        await asyncio.sleep(FORM_POLL_INTERVAL)
 
 
-def fill_field(page_or_frame, field_key: str, value: str, board: dict, config: dict) -> bool:
+async def fill_field(page_or_frame, selectors: tuple[str, ...], value: str) -> bool:
     """Try each CSS selector for this field in order; fill and return True on first match. Returns False if no selector matches or value is empty."""
-    if not value:
-        return False
-    fields_config = board.get("fields", {})
-    selectors = fields_config.get(field_key, [])
-    if not selectors:
+    if not value or not selectors:
         return False
     for sel in selectors:
         try:
-            el = page_or_frame.query_selector(sel)
+            el = await page_or_frame.query_selector(sel)
             if el:
-                el.fill(value)
+                await el.fill(value)
                 return True
         except Exception:
             continue
     return False
 
 
-def fill_form_with_board(page_or_frame, board: dict, config: dict, job_title: str, company: str):
+# In-page helper: for each [key, selectors, value], set the first usable match and fire input/change
+# events. Uses the native value setter so React-controlled inputs pick up the change. Like Playwright's
+# fill, it skips elements that can't take typed text (hidden, file, checkbox, ... or not visible), and a
+# field that throws only skips that field.
+FILL_FIELDS_JS = """
+(fields) => {
+    const SKIP_TYPES = new Set(["hidden", "file", "checkbox", "radio", "submit", "button", "image", "reset"]);
+    const usable = (el) =>
+        (el instanceof HTMLTextAreaElement || (el instanceof HTMLInputElement && !SKIP_TYPES.has(el.type)))
+        && !el.disabled && !el.readOnly && el.getClientRects().length > 0;
+    const filled = [];
+    for (const [key, selectors, value] of fields) {
+        try {
+            for (const sel of selectors) {
+                let matches = [];
+                try { matches = document.querySelectorAll(sel); } catch (e) { continue; }
+                const el = Array.from(matches).find(usable);
+                if (!el) continue;
+                const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+                Object.getOwnPropertyDescriptor(proto, "value").set.call(el, value);
+                el.dispatchEvent(new Event("input", { bubbles: true }));
+                el.dispatchEvent(new Event("change", { bubbles: true }));
+                filled.push(key);
+                break;
+            }
+        } catch (e) {
+            continue;
+        }
+    }
+    return filled;
+}
+"""
+
+NAME_KEYS = {"first_name", "last_name", "name"}  # Either first/last or a single name field is enough
+
+
+async def fill_fields(page_or_frame, values: list[tuple[str, tuple[str, ...], str]]) -> list[str]:
+    """Fill several (field_key, selectors, value) entries in one page.evaluate, in order. Returns the keys that were filled.
+
+    Prints a warning listing fields that have a value and selectors but couldn't be filled.
+    """
+    fields = [[key, list(selectors), value] for key, selectors, value in values if value and selectors]
+    if not fields:
+        return []
+    try:
+        filled = await page_or_frame.evaluate(FILL_FIELDS_JS, fields)
+    except Exception as e:
+        worker_print(f"   - WARNING: Could not fill form fields: {e}")
+        return []
+    missing = [key for key, _, _ in fields if key not in filled]
+    if NAME_KEYS & set(filled):
+        missing = [key for key in missing if key not in NAME_KEYS]
+    if missing:
+        worker_print(f"   - WARNING: No fillable field found for: {', '.join(missing)}")
+    return filled
+
+
+async def fill_form_with_board(page_or_frame, board: BoardRecord, config: dict, job_title: str, company: str):
     """Fill all standard fields (name, email, phone, LinkedIn, cover letter, resume) using the board's selectors."""
     # Name: try first/last, then full "name" (Lever/Ashby sometimes use one field)
     full_name = f"{config.get('first_name', '')} {config.get('last_name', '')}".strip()
-    fill_field(page_or_frame, "first_name", config.get("first_name", ""), board, config)
-    fill_field(page_or_frame, "last_name", config.get("last_name", ""), board, config)
-    if full_name:
-        fill_field(page_or_frame, "name", full_name, board, config)
-    fill_field(page_or_frame, "email", config.get("email", ""), board, config)
-    fill_field(page_or_frame, "phone", config.get("phone", ""), board, config)
+    values = [
+        ("first_name", board.first_name_sels, config.get("first_name", "")),
+        ("last_name", board.last_name_sels, config.get("last_name", "")),
+        ("name", board.name_sels, full_name),
+        ("email", board.email_sels, config.get("email", "")),
+        ("phone", board.phone_sels, config.get("phone", "")),
+    ]
 
     # LinkedIn: use label text if board defines it (e.g. Greenhouse), else try selectors
     linkedin = config.get("linkedin_url", "")
     if linkedin:
-        if board.get("linkedin_label"):
+        if board.linkedin_label:
             try:
-                inp = page_or_frame.get_by_label(board["linkedin_label"])
-                if inp.count() > 0:
-                    inp.fill(linkedin)
+                inp = page_or_frame.get_by_label(board.linkedin_label)
+                if await inp.count() > 0:
+                    await inp.fill(linkedin)
             except Exception:
-                fill_field(page_or_frame, "linkedin_url", linkedin, board, config)
+                await fill_field(page_or_frame, board.linkedin_url_sels, linkedin)
         else:
-            fill_field(page_or_frame, "linkedin_url", linkedin, board, config)
+            values.append(("linkedin_url", board.linkedin_url_sels, linkedin))
 
     # Cover letter: substitute {job_title} and {company_name} from template
     cover = config.get("cover_letter") or config.get("cover_letter_template", "")
     if cover:
         cover = fill_cover_letter_template(cover, job_title, company)
-        fill_field(page_or_frame, "cover_letter", cover, board, config)
+        values.append(("cover_letter", board.cover_letter_sels, cover))
+
+    # All text fields in a single round-trip
+    await fill_fields(page_or_frame, values)
 
     # Resume: set file on the first matching file input
     resume_path = config.get("resume_path", "")
     if resume_path and os.path.exists(resume_path):
-        selectors = board.get("fields", {}).get("resume", ["input[type='file']"])
+        selectors = board.resume_sels or ("input[type='file']",)
         for sel in selectors:
             try:
-                page_or_frame.set_input_files(sel, resume_path)
-                print(f"   - Uploaded resume from {resume_path}")
+                await page_or_frame.set_input_files(sel, resume_path)
+                worker_print(f"   - Uploaded resume from {resume_path}")
                 break
             except Exception:
                 continue
     else:
         if resume_path:
-            print(f"   - WARNING: Resume not found at {resume_path}")
+            worker_print(f"   - WARNING: Resume not found at {resume_path}")
 
 
-def apply_to_job(main_page, url: str, config: dict, board_id: str, index: int, total: int) -> bool:
-    """Navigate to job URL, show role/company, find and fill form, wait for user to submit and press Enter. Records applied URL and logs to applications.log. Returns True if form was found and filled."""
+async def prepare_job(page, url: str, config: dict, board_id: str, index: int, total: int) -> tuple[str, str] | None:
+    """Navigate to job URL, read role/company, find and fill the form. Returns (job_title, company) if the form was filled, else None."""
     board = get_board(board_id)
     if not board:
-        print(f"   - Unknown board for URL; skipping.")
-        return False
-
-    print(f"\n[{index}/{total}] Navigating to {url}...")
-    main_page.goto(url)
-    human_delay(2, 4)
+        worker_print(f"[{index}/{total}] - Unknown board for URL; skipping.")
+        return None
 
-    # Job context (use main page for title/company; they're usually not in iframe)
-    job_title, company = get_job_context(main_page, board)
-    print(f"   Role: {job_title}")
-    print(f"   Company: {company}")
+    worker_print(f"[{index}/{total}] Navigating to {url}...")
+    try:
+        await page.goto(url, wait_until="domcontentloaded")
+    except PlaywrightTimeoutError:
+        pass  # Slow page; carry on and let find_form wait for the form
 
-    form, form_page = find_form(main_page, board)
+    # find_form waits for the form itself, so no fixed delay is needed after navigation
+    form, form_page = await find_form(page, board)
     if not form or not form_page:
-        print("   - Application form not found.")
+        worker_print(f"[{index}/{total}] - Application form not found.")
         try:
             with open("debug_page.html", "w", encoding="utf-8") as f:
-                f.write(main_page.content())
-            print("   - Dumped page to debug_page.html")
+                f.write(await page.content())
+            worker_print(f"[{index}/{total}] - Dumped page to debug_page.html")
         except Exception as e:
-            print(f"   - Could not dump page: {e}")
-        return False
+            worker_print(f"[{index}/{total}] - Could not dump page: {e}")
+        return None
 
-    print(f"   - Form found ({board['name']}). Filling...")
-    fill_form_with_board(form_page, board, config, job_title, company)
+    # Job context (use main page for title/company; they're usually not in iframe)
+    job_title, company = await get_job_context(page, board)
+    await fill_form_with_board(form_page, board, config, job_title, company)
+    return job_title, company
+
+
+async def apply_to_job(page, url: str, board_id: str, job_title: str, company: str, applied: AppliedStore, log_fh, index: int, total: int):
+    """Bring a prepared job page to the front, wait for user to submit and press Enter. Records applied URL and logs to applications.log."""
+    board = get_board(board_id)
+    print(f"\n[{index}/{total}] {url}")
+    print(f"   Role: {job_title}")
+    print(f"   Company: {company}")
+    await page.bring_to_front()
 
-    print("   - Form filled. Complete any custom questions and submit in the browser.")
+    print(f"   - Form filled ({board.name}). Complete any custom questions and submit in the browser.")
     print("   - Press ENTER in this terminal when done to continue to the next job.")
-    input("   >> Press Enter to continue... ")
+    # Workers keep preparing the next pages while this waits
+    await prompt_enter("   >> Press Enter to continue... ")
+
+    applied.add(url)
+    log_application(log_fh, url, job_title, company, board.name)
+
+
+async def job_worker(context, queue: asyncio.Queue, ready: dict, config: dict, total: int):
+    """Take (index, url) jobs off the queue and prepare each on a fresh page in this context.
+
+    The result is handed to the consumer through ready[index]; the worker then waits until the
+    user is done with that page before preparing its next job, so at most one page per context is open.
+    """
+    while True:
+        try:
+            i, url = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+        board_id = detect_board_from_url(url) or config.get("board", "greenhouse")
+        page, prepared = None, None
+        done = asyncio.Event()
+        try:
+            page = await context.new_page()
+            prepared = await prepare_job(page, url, config, board_id, i + 1, total)
+        except Exception as e:
+            worker_print(f"[{i + 1}/{total}] - Error preparing {url}: {e}")
+        finally:
+            # Always resolve ready[i], or the consumer would wait on it forever
+            ready[i].set_result((page, board_id, prepared, done))
+        await done.wait()
+        if page:
+            try:
+                await page.close()
+            except Exception:
+                pass  # Browser already closed
+
 
-    save_applied_job(url)
-    log_application(url, job_title, company, board["name"])
-    return True
+async def wait_ready(future: asyncio.Future, workers: list):
+    """Wait for a job's ready future; raise if the workers die before resolving it instead of hanging."""
+    while not future.done():
+        for w in workers:
+            if w.done() and not w.cancelled() and w.exception():
+                raise w.exception()
+        running = [w for w in workers if not w.done()]
+        if not running:
+            raise RuntimeError("All workers stopped before every job was prepared.")
+        await asyncio.wait([future, *running], return_when=asyncio.FIRST_COMPLETED)
+    return future.result()
 
 
 # ---------------------------------------------------------------------------
 # Entry point: load config, get job list (from config or search), then apply to each
 # ---------------------------------------------------------------------------
-def main():
-    import argparse
-    parser = argparse.ArgumentParser(description="Apply to jobs on Greenhouse, Lever, Ashby, etc.")
-    parser.add_argument("--resume", action="store_true", help="Resume from last progress (skip applied)")
-    parser.add_argument("--board", choices=list(BOARDS.keys()) + ["all"], default=None, help="Board to search (default: all or from config)")
-    args = parser.parse_args()
-
+async def amain(args):
+    """Run the whole flow (job list, search, parallel preparation, user submits) on the async Playwright driver."""
     config = load_config()
-    applied = load_applied_jobs()
+    applied = AppliedStore()
 
-    # Decide job list source: manual URLs from config vs search (done later inside browser)
+    # Decide job list source: manual URLs from config vs search (cache, HTTP, or later inside the browser)
     job_urls = []
     from_search = False
     if config.get("job_urls"):
@@ -348,28 +743,61 @@ def main():
                 print(f"Skipping {len(applied)} already applied; {len(job_urls)} jobs to process.")
             clear_progress()
     else:
-        from_search = True  # We'll search in the browser and build job_urls there
         clear_progress()
+        query = config.get("job_search_query", "engineer")
+        board_id = args.board or config.get("board", "all")
+        found = None if args.refresh_search else get_cached_search(board_id, query)
+        if found is not None:
+            print(f"Using {len(found)} cached search results (--refresh-search to search again)")
+        else:
+            # Lightweight HTTP search first, so Chromium only starts if there's something new to apply to
+            found = await search_jobs_via_http(query, board_id)
+            if found:
+                print(f"Found {len(found)} job links.")
+                cache_search(board_id, query, found)
+        if found is not None:
+            job_urls = [u for u in found if u not in applied]
+            if applied:
+                print(f"Skipping {len(applied)} already applied; {len(job_urls)} jobs to process.")
+        else:
+            from_search = True  # HTTP search unavailable or blocked; search in the browser instead
 
-    # If we already have URLs and the list is empty after filtering, exit before opening browser
+    # If we already have URLs (config, cache or HTTP search) and none are left after filtering, exit before opening browser
     if not from_search and not job_urls:
         print("No jobs left to process.")
         return
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False)
-        context = browser.new_context()
-        page = context.new_page()
+    async with async_playwright() as p:
+        if not chromium_installed(p):
+            return
+
+        if args.persistent:
+            # One profile-backed context shared by the search and all workers; closing it closes the browser.
+            # A larger HTTP disk cache keeps more of the careers sites' assets between runs; it only takes
+            # effect because this context is never routed (routing disables the cache).
+            shared = await p.chromium.launch_persistent_context(
+                PROFILE_DIR, headless=False, args=[f"--disk-cache-size={PROFILE_DISK_CACHE_BYTES}"]
+            )
+            shared.set_default_navigation_timeout(NAVIGATION_TIMEOUT_MS)
+            # No route() here: routing disables the HTTP cache, which is what the persistent profile is for.
+            # Heavy resources load normally but are served from the warm cache on repeat visits.
+            browser = shared
+        else:
+            shared = None
+            browser = await p.chromium.launch(headless=False)
 
         # If not using config job_urls, run DuckDuckGo search and collect links
         if from_search:
-            query = config.get("job_search_query", "engineer")
-            board_id = args.board or config.get("board", "all")
-            job_urls = search_jobs_via_browser(page, query, board_id)
+            search_context = shared or await new_context(browser)
+            page = search_context.pages[0] if search_context.pages else await search_context.new_page()
+            job_urls = await search_jobs_via_browser(page, query, board_id)
+            if not shared:
+                await search_context.close()
             if not job_urls:
                 print("No job links found. Exiting.")
-                browser.close()
+                await browser.close()
                 return
+            cache_search(board_id, query, job_urls)
             print(f"Found {len(job_urls)} job links.")
             job_urls = [u for u in job_urls if u not in applied]
             if applied:
@@ -377,21 +805,57 @@ def main():
 
         if not job_urls:
             print("No jobs left to process.")
-            browser.close()
+            await browser.close()
             return
 
         total = len(job_urls)
         print(f"\nProcessing {total} job(s). Board is auto-detected from each URL.\n")
 
-        # Process each job: detect board from URL, fill form, wait for user, then save progress
+        # Workers (one isolated context each, or the shared persistent one) navigate and fill forms in parallel; ready[i] is
+        # resolved when job i is prepared, and the loop below hands them to the user in order.
+        queue = asyncio.Queue()
         for i, url in enumerate(job_urls):
-            board_id = detect_board_from_url(url) or config.get("board", "greenhouse")
-            apply_to_job(page, url, config, board_id, i + 1, total)
-            save_progress(job_urls, i)
+            queue.put_nowait((i, url))
+        loop = asyncio.get_running_loop()
+        ready = {i: loop.create_future() for i in range(total)}
+        contexts = [shared or await new_context(browser) for _ in range(max(1, min(args.workers, total)))]
+        workers = [asyncio.create_task(job_worker(ctx, queue, ready, config, total)) for ctx in contexts]
 
+        # Job list is written once; each finished job only rewrites the tiny index file
+        start_progress(job_urls)
+
+        log_fh = open(APPLICATIONS_LOG, "a", buffering=1, encoding="utf-8")
+        try:
+            for i, url in enumerate(job_urls):
+                page, board_id, prepared, done = await wait_ready(ready[i], workers)
+                try:
+                    if page and prepared:
+                        job_title, company = prepared
+                        await apply_to_job(page, url, board_id, job_title, company, applied, log_fh, i + 1, total)
+                finally:
+                    done.set()
+                save_progress(i)
+        finally:
+            log_fh.close()
+            applied.close()
+
+        await asyncio.gather(*workers)
         clear_progress()
         print("\nAll jobs processed.")
-        browser.close()
+        await browser.close()
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Apply to jobs on Greenhouse, Lever, Ashby, etc.")
+    parser.add_argument("--resume", action="store_true", help="Resume from last progress (skip applied)")
+    parser.add_argument("--board", choices=list(BOARDS.keys()) + ["all"], default=None, help="Board to search (default: all or from config)")
+    parser.add_argument("--refresh-search", action="store_true", help=f"Ignore {SEARCH_CACHE_FILE} and search DuckDuckGo again")
+    parser.add_argument("--persistent", action="store_true", help=f"Reuse a browser profile in {PROFILE_DIR} (cookies, cache, logins) across runs")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help=f"Job pages prepared in parallel (default: {DEFAULT_WORKERS})")
+    args = parser.parse_args()
+
+    asyncio.run(amain(args))
 
 
 if __name__ == "__main__":
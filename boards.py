@@ -8,15 +8,24 @@ Each board entry defines:
 - form_selector: CSS selector for the application form (tried on main page then in iframes if form_in_iframe)
 - fields: map of field key -> list of CSS selectors (tried in order until one matches)
 - linkedin_label: optional label text for LinkedIn (e.g. "LinkedIn Profile") when not using a selector
+
+The raw entries are converted once at import time into immutable BoardRecord objects (BOARDS),
+with each field's selectors flattened into its own attribute (e.g. email_sels).
 """
 
+import re
+from dataclasses import dataclass
+
 # Config keys that map to form fields (used for validation/documentation)
 CONFIG_KEYS = ["first_name", "last_name", "email", "phone", "linkedin_url", "resume_path", "cover_letter"]
 
+# Form field keys a board can define selectors for (each becomes a <key>_sels attribute on BoardRecord)
+FIELD_KEYS = ["name", "first_name", "last_name", "email", "phone", "linkedin_url", "resume", "cover_letter"]
+
 # ---------------------------------------------------------------------------
 # Board definitions: Greenhouse, Lever, Ashby (no-account apply flows)
 # ---------------------------------------------------------------------------
-BOARDS = {
+_RAW_BOARDS = {
     # ----- Greenhouse (boards.greenhouse.io) -----
     "greenhouse": {
         "id": "greenhouse",
@@ -116,20 +125,74 @@ BOARDS = {
 }
 
 
+@dataclass(frozen=True, slots=True)
+class BoardRecord:
+    """One board definition, flattened into plain attributes (built once from _RAW_BOARDS)."""
+
+    id: str
+    name: str
+    search_site: str
+    url_patterns: tuple[str, ...]
+    job_title_selectors: tuple[str, ...]
+    company_selectors: tuple[str, ...]
+    form_selector: str
+    form_in_iframe: bool
+    linkedin_label: str | None
+    # Field selectors, tried in order until one matches
+    name_sels: tuple[str, ...]
+    first_name_sels: tuple[str, ...]
+    last_name_sels: tuple[str, ...]
+    email_sels: tuple[str, ...]
+    phone_sels: tuple[str, ...]
+    linkedin_url_sels: tuple[str, ...]
+    resume_sels: tuple[str, ...]
+    cover_letter_sels: tuple[str, ...]
+
+
+def _from_dict(d: dict) -> BoardRecord:
+    """Build a BoardRecord from a raw board entry."""
+    fields = d.get("fields", {})
+    return BoardRecord(
+        id=d["id"],
+        name=d["name"],
+        search_site=d["search_site"],
+        url_patterns=tuple(d["url_patterns"]),
+        job_title_selectors=tuple(d.get("job_title_selectors", [])),
+        company_selectors=tuple(d.get("company_selectors", [])),
+        form_selector=d.get("form_selector", "form"),
+        form_in_iframe=bool(d.get("form_in_iframe")),
+        linkedin_label=d.get("linkedin_label"),
+        **{f"{key}_sels": tuple(fields.get(key, [])) for key in FIELD_KEYS},
+    )
+
+
+BOARDS = {bid: _from_dict(d) for bid, d in _RAW_BOARDS.items()}
+
+
+def _url_pattern_regex(board: BoardRecord) -> str:
+    """Regex source matching a URL that contains the board's url_patterns (in the order listed)."""
+    return ".*".join(re.escape(p) for p in board.url_patterns)
+
+
+# One compiled alternation over every board; the named group that matched is the board id
+BOARD_RE = re.compile(
+    "|".join(f"(?P<{bid}>{_url_pattern_regex(board)})" for bid, board in BOARDS.items()),
+    re.IGNORECASE,
+)
+
+
 def detect_board_from_url(url: str) -> str | None:
     """Return board id (e.g. 'greenhouse') if URL matches a known board's url_patterns."""
-    url_lower = url.lower()
-    for bid, board in BOARDS.items():
-        if all(p in url_lower for p in board["url_patterns"]):
-            return bid
-    return None
+    m = BOARD_RE.search(url)
+    return m.lastgroup if m else None
 
 
-def get_board(board_id: str) -> dict | None:
-    """Return the board config dict for the given id, or None."""
+def get_board(board_id: str) -> BoardRecord | None:
+    """Return the BoardRecord for the given id, or None."""
     return BOARDS.get(board_id)
 
 
 def get_search_site(board_id: str) -> str:
     """Return the DuckDuckGo site: query string for the board (e.g. 'site:boards.greenhouse.io')."""
-    return BOARDS.get(board_id, {}).get("search_site", "site:boards.greenhouse.io")
+    board = BOARDS.get(board_id)
+    return board.search_site if board else "site:boards.greenhouse.io"